@@ -0,0 +1,192 @@
+"""
+Async Binance Futures Testnet REST client.
+Shares one keep-alive connection pool across concurrent signed requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import aiohttp
+from yarl import URL
+
+from bot.client import BASE_URL, BinanceAPIError, _BinanceClientBase, _encode, _json_loads
+from bot.logging_config import setup_logging
+
+logger = setup_logging()
+
+
+class AsyncBinanceFuturesClient(_BinanceClientBase):
+    """
+    asyncio counterpart of :class:`BinanceFuturesClient`.
+
+    Use as an async context manager so the underlying session is opened
+    and closed cleanly:
+
+        async with AsyncBinanceFuturesClient(key, secret) as client:
+            await client.place_orders([...])
+
+    Parameters
+    ----------
+    api_key:    Testnet API key
+    api_secret: Testnet API secret
+    """
+
+    def __init__(self, api_key: str, api_secret: str):
+        super().__init__(api_key, api_secret)
+        self._session: aiohttp.ClientSession | None = None
+        logger.debug("AsyncBinanceFuturesClient initialised (testnet)")
+
+    async def __aenter__(self) -> "AsyncBinanceFuturesClient":
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                headers={
+                    "X-MBX-APIKEY": self._api_key,
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+            )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # ── Internal helpers ──────────────────────────────────────────────────
+
+    async def _sync_time(self) -> None:
+        """Measure the local clock's offset to Binance server time."""
+        sent_ms = time.time_ns() // 1_000_000
+        self._apply_server_time(await self.get_server_time(), sent_ms)
+
+    async def _request(self, method: str, endpoint: str, params: dict | None = None, signed: bool = True) -> Any:
+        """
+        Execute a request and return the parsed JSON response.
+        Requests are signed unless ``signed`` is False (public endpoints).
+
+        Raises:
+            BinanceAPIError: on API-level errors
+            aiohttp.ClientError: on network-level errors
+            asyncio.TimeoutError: when the request exceeds its 10 s timeout
+        """
+        if self._session is None:
+            raise RuntimeError("Client session is not open; use 'async with'.")
+
+        url = f"{BASE_URL}{endpoint}"
+        method = method.upper()
+        if signed:
+            if self._time_sync_due():
+                await self._sync_time()
+            query = self._sign(params or {})
+        else:
+            query = _encode(params or {})
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("→ %s %s | params: %s", method, endpoint, query.partition("&signature=")[0])
+
+        try:
+            async with self._session.request(
+                method,
+                # encoded=True stops yarl from re-quoting the signed query
+                URL(f"{url}?{query}", encoded=True) if method != "POST" and query else url,
+                data=query.encode("utf-8") if method == "POST" else None,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                body = await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.error("Network error: %s", str(exc) or type(exc).__name__)  # timeouts carry no message
+            raise
+
+        if debug:
+            logger.debug("← HTTP %s | body: %s", resp.status, body[:500].decode("utf-8", "replace"))
+
+        try:
+            data = _json_loads(body)
+        except ValueError:
+            resp.raise_for_status()
+            raise
+
+        if isinstance(data, dict) and "code" in data and data["code"] != 200:
+            raise BinanceAPIError(data["code"], data.get("msg", "Unknown error"))
+
+        resp.raise_for_status()
+        return data
+
+    # ── Public API ────────────────────────────────────────────────────────
+
+    async def get_server_time(self) -> int:
+        """Return Binance server timestamp (ms)."""
+        data = await self._request("GET", "/fapi/v1/time", signed=False)
+        return data["serverTime"]
+
+    async def get_exchange_info(self, symbol: str | None = None) -> dict:
+        """Return exchange info, optionally filtered by symbol."""
+        params = {}
+        if symbol:
+            params["symbol"] = symbol.upper()
+        return await self._request("GET", "/fapi/v1/exchangeInfo", params, signed=False)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: float | None = None,
+        time_in_force: str = "GTC",
+        stop_price: float | None = None,
+        reduce_only: bool = False,
+    ) -> dict:
+        """Place a futures order on the testnet (see BinanceFuturesClient.place_order)."""
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, time_in_force, stop_price, reduce_only
+        )
+        return await self._request("POST", "/fapi/v1/order", params)
+
+    async def place_orders(self, orders: list[dict]) -> list[Any]:
+        """
+        Place several orders concurrently over the shared connection pool.
+
+        Each item holds the keyword arguments of :meth:`place_order`.
+        One failure does not discard the others: the result holds, per order
+        and in the same order as ``orders``, the Binance response dict or the
+        exception that order failed with (BinanceAPIError,
+        aiohttp.ClientError, asyncio.TimeoutError, ValueError).
+        """
+        if not orders:
+            return []
+        if self._time_sync_due():
+            await self._sync_time()  # once here rather than in every task
+        outcomes = await asyncio.gather(*[self.place_order(**o) for o in orders], return_exceptions=True)
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Order #%d (%s) failed: %s", i, orders[i].get("symbol"), outcome)
+        return outcomes
+
+    async def get_open_orders(self, symbol: str | None = None) -> list:
+        """Fetch all open orders, optionally filtered by symbol."""
+        params = {}
+        if symbol:
+            params["symbol"] = symbol.upper()
+        return await self._request("GET", "/fapi/v1/openOrders", params)
+
+    async def cancel_order(self, symbol: str, order_id: int) -> dict:
+        """Cancel a specific order by orderId."""
+        return await self._request(
+            "DELETE",
+            "/fapi/v1/order",
+            {"symbol": symbol.upper(), "orderId": order_id},
+        )
+
+    async def get_account_balance(self) -> list:
+        """Return futures wallet balances."""
+        return await self._request("GET", "/fapi/v2/balance", {})
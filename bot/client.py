@@ -7,17 +7,46 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import json
+import logging
 import time
-from typing import Any
-from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, TypedDict
+from urllib.parse import quote_plus
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from bot.logging_config import setup_logging
 
+try:  # optional, markedly faster on large payloads such as exchangeInfo
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 BASE_URL = "https://testnet.binancefuture.com"
 logger = setup_logging()
 
+# Seconds before the cached /exchangeInfo payload is refetched
+EXCHANGE_INFO_TTL = 300
+
+# Seconds between re-syncs of the local clock offset to Binance server time
+TIME_SYNC_INTERVAL = 30 * 60
+
+# Upper bound on concurrent requests issued by BinanceFuturesClient.batch()
+BATCH_MAX_WORKERS = 16
+
+# Both decoders accept raw bytes, which skips the intermediate str decode.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _encode(params: dict) -> str:
+    """urlencode params in insertion order (same output as urllib's urlencode)."""
+    return "&".join(f"{k}={quote_plus(str(v))}" for k, v in params.items())
+
 
 class BinanceAPIError(Exception):
     """Raised when Binance returns a non-2xx response or an error payload."""
@@ -28,7 +57,131 @@ class BinanceAPIError(Exception):
         super().__init__(f"[Binance {code}] {message}")
 
 
-class BinanceFuturesClient:
+# ── Order param builders (one per order type, see _BinanceClientBase._BUILDERS) ──
+
+def _build_market(symbol, side, quantity, price, stop_price, time_in_force) -> dict[str, Any]:
+    return {"symbol": symbol, "side": side, "type": "MARKET", "quantity": quantity}
+
+
+def _build_limit(symbol, side, quantity, price, stop_price, time_in_force) -> dict[str, Any]:
+    if price is None:
+        raise ValueError("price is required for LIMIT orders")
+    return {
+        "symbol": symbol,
+        "side": side,
+        "type": "LIMIT",
+        "quantity": quantity,
+        "price": price,
+        "timeInForce": time_in_force,
+    }
+
+
+def _build_stop_market(symbol, side, quantity, price, stop_price, time_in_force) -> dict[str, Any]:
+    if stop_price is None:
+        raise ValueError("stopPrice is required for STOP_MARKET orders")
+    return {"symbol": symbol, "side": side, "type": "STOP_MARKET", "quantity": quantity, "stopPrice": stop_price}
+
+
+class _BatchCallBase(TypedDict):
+    method: str
+    endpoint: str
+    params: dict
+
+
+class BatchCall(_BatchCallBase, total=False):
+    """
+    One REST call for :meth:`BinanceFuturesClient.batch`.
+
+    ``input_from`` is the index of an earlier call whose result feeds this
+    one: params left as ``None`` are filled from that result by key.
+    """
+
+    input_from: int
+
+
+class _BinanceClientBase:
+    """
+    Transport-independent state shared by the sync and async clients:
+    credentials, HMAC signing, server-time offset and order param building.
+    """
+
+    # Order type -> params builder; keeps the hot path free of type branches
+    _BUILDERS = {
+        "MARKET": _build_market,
+        "LIMIT": _build_limit,
+        "STOP_MARKET": _build_stop_market,
+    }
+
+    def __init__(self, api_key: str, api_secret: str):
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._api_secret_bytes = api_secret.encode("utf-8")
+        # Keyed HMAC state; copying it skips the key schedule on every signature
+        self._hmac_template = hmac.new(self._api_secret_bytes, None, hashlib.sha256)
+        # Server time minus local time (ms), refreshed every TIME_SYNC_INTERVAL
+        self._time_offset_ms = 0
+        self._time_synced_at: float | None = None
+
+    def _time_sync_due(self) -> bool:
+        return self._time_synced_at is None or time.monotonic() - self._time_synced_at > TIME_SYNC_INTERVAL
+
+    def _apply_server_time(self, server_time: int, sent_ms: int) -> None:
+        """Store the clock offset, assuming the server stamped mid round-trip."""
+        local_ms = (sent_ms + time.time_ns() // 1_000_000) // 2
+        self._time_offset_ms = server_time - local_ms
+        self._time_synced_at = time.monotonic()
+        logger.debug("Clock offset to Binance server time: %d ms", self._time_offset_ms)
+
+    def _sign(self, params: dict) -> str:
+        """
+        Return the query string for params with timestamp and HMAC-SHA256
+        signature appended.
+
+        The string is built once, in insertion order, and sent verbatim so
+        the HTTP layer does not urlencode the same params a second time.
+        The timestamp is corrected by the offset to server time, which
+        avoids -1021 rejects on machines with a skewed clock.
+        """
+        query = _encode(params)
+        timestamp = time.time_ns() // 1_000_000 + self._time_offset_ms
+        query = f"{query}&timestamp={timestamp}" if query else f"timestamp={timestamp}"
+        h = self._hmac_template.copy()
+        h.update(query.encode("utf-8"))
+        return f"{query}&signature={h.hexdigest()}"
+
+    @classmethod
+    def _build_order_params(
+        cls,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: float | None = None,
+        time_in_force: str = "GTC",
+        stop_price: float | None = None,
+        reduce_only: bool = False,
+    ) -> dict[str, Any]:
+        """Build and log the request params for a new order."""
+        builder = cls._BUILDERS.get(order_type)
+        if builder is None:
+            raise ValueError(f"Unsupported order type '{order_type}'")
+        params = builder(symbol, side, quantity, price, stop_price, time_in_force)
+
+        if reduce_only:
+            params["reduceOnly"] = "true"
+
+        logger.info(
+            "Placing %s %s order | symbol=%s qty=%s price=%s",
+            side,
+            order_type,
+            symbol,
+            quantity,
+            price or stop_price or "N/A",
+        )
+        return params
+
+
+class BinanceFuturesClient(_BinanceClientBase):
     """
     Lightweight wrapper around Binance USDT-M Futures REST API.
 
@@ -39,58 +192,99 @@ class BinanceFuturesClient:
     """
 
     def __init__(self, api_key: str, api_secret: str):
-        self._api_key = api_key
-        self._api_secret = api_secret
+        super().__init__(api_key, api_secret)
+        self._exch_cache: tuple[float, dict] | None = None
+        self._symbols_set: set[str] = set()
+        # symbol -> (tickSize, stepSize) from PRICE_FILTER / LOT_SIZE
+        self._symbol_steps: dict[str, tuple[Decimal, Decimal]] = {}
         self._session = requests.Session()
         self._session.headers.update(
             {
                 "X-MBX-APIKEY": self._api_key,
                 "Content-Type": "application/x-www-form-urlencoded",
+                "Connection": "keep-alive",
             }
         )
+        # All traffic goes to one host, so a single pool of reusable
+        # keep-alive connections is enough. Order placement (POST) is not
+        # retried on error statuses: the order may already have been accepted.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "DELETE"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry),
+        )
         logger.debug("BinanceFuturesClient initialised (testnet)")
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
-    def _sign(self, params: dict) -> dict:
-        """Append HMAC-SHA256 signature to params dict."""
-        params["timestamp"] = int(time.time() * 1000)
-        query = urlencode(params)
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),
-            query.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        params["signature"] = signature
-        return params
+    def _sync_time(self) -> None:
+        """Measure the local clock's offset to Binance server time."""
+        sent_ms = time.time_ns() // 1_000_000
+        self._apply_server_time(self.get_server_time(), sent_ms)
 
-    def _request(self, method: str, endpoint: str, params: dict | None = None) -> Any:
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        signed: bool = True,
+        stream: bool = False,
+    ) -> Any:
         """
-        Execute a signed request and return the parsed JSON response.
+        Execute a request and return the parsed JSON response.
+        Requests are signed unless ``signed`` is False (public endpoints).
+        ``stream`` reads the raw socket bytes straight into the JSON decoder,
+        which is cheaper for large payloads such as exchangeInfo.
 
         Raises:
             BinanceAPIError: on API-level errors
             requests.RequestException: on network-level errors
         """
         url = f"{BASE_URL}{endpoint}"
-        params = params or {}
-        signed = self._sign(params)
-
-        logger.debug("→ %s %s | params: %s", method.upper(), endpoint, {k: v for k, v in signed.items() if k != "signature"})
+        method = method.upper()
+        if signed:
+            if self._time_sync_due():
+                self._sync_time()
+            query = self._sign(params or {})
+        else:
+            query = _encode(params or {})
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("→ %s %s | params: %s", method, endpoint, query.partition("&signature=")[0])
 
         try:
-            if method.upper() == "GET":
-                resp = self._session.get(url, params=signed, timeout=10)
+            if method == "POST":
+                resp = self._session.post(url, data=query, timeout=10)
             else:
-                resp = self._session.post(url, data=signed, timeout=10)
+                resp = self._session.request(
+                    method, f"{url}?{query}" if query else url, timeout=10, stream=stream
+                )
+            if stream:
+                try:
+                    body = resp.raw.read(decode_content=True)
+                except urllib3.exceptions.HTTPError as exc:
+                    raise requests.ConnectionError(exc, response=resp) from exc
+                finally:
+                    resp.close()
+            else:
+                body = resp.content
         except requests.RequestException as exc:
             logger.error("Network error: %s", exc)
             raise
 
-        logger.debug("← HTTP %s | body: %s", resp.status_code, resp.text[:500])
+        if debug:
+            logger.debug("← HTTP %s | body: %s", resp.status_code, body[:500].decode("utf-8", "replace"))
 
         try:
-            data = resp.json()
+            data = _json_loads(body)
         except ValueError:
             resp.raise_for_status()
             raise
@@ -105,15 +299,81 @@ class BinanceFuturesClient:
 
     def get_server_time(self) -> int:
         """Return Binance server timestamp (ms)."""
-        data = self._request("GET", "/fapi/v1/time")
+        data = self._request("GET", "/fapi/v1/time", signed=False)
         return data["serverTime"]
 
     def get_exchange_info(self, symbol: str | None = None) -> dict:
-        """Return exchange info, optionally filtered by symbol."""
-        params = {}
+        """
+        Return exchange info, optionally filtered by symbol.
+
+        The unfiltered payload is cached for EXCHANGE_INFO_TTL seconds and
+        also feeds :meth:`known_symbols` and :meth:`round_order`.
+        """
         if symbol:
-            params["symbol"] = symbol.upper()
-        return self._request("GET", "/fapi/v1/exchangeInfo", params)
+            return self._request("GET", "/fapi/v1/exchangeInfo", {"symbol": symbol.upper()}, signed=False)
+
+        now = time.monotonic()
+        if self._exch_cache is None or now - self._exch_cache[0] > EXCHANGE_INFO_TTL:
+            data = self._request("GET", "/fapi/v1/exchangeInfo", signed=False, stream=True)
+            symbols = data.get("symbols", [])
+            self._symbols_set = {s["symbol"] for s in symbols}
+            self._symbol_steps = {}
+            for s in symbols:
+                filters = {f["filterType"]: f for f in s.get("filters", [])}
+                if "PRICE_FILTER" in filters and "LOT_SIZE" in filters:
+                    self._symbol_steps[s["symbol"]] = (
+                        Decimal(filters["PRICE_FILTER"]["tickSize"]),
+                        Decimal(filters["LOT_SIZE"]["stepSize"]),
+                    )
+            self._exch_cache = (now, data)
+        return self._exch_cache[1]
+
+    def known_symbols(self) -> set[str]:
+        """Return the set of symbols listed on the exchange (cached)."""
+        self.get_exchange_info()
+        return self._symbols_set
+
+    def round_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float | None = None,
+        stop_price: float | None = None,
+    ) -> tuple[float | str, float | str | None, float | str | None]:
+        """
+        Snap an order to the symbol's exchange filters so Binance does not
+        reject it (-1111 / -1013). Quantity is floored to stepSize; prices
+        move to tickSize only in the trader's favour (down for BUY, up for
+        SELL). A no-op until exchange info has been cached.
+
+        Returns:
+            (quantity, price, stop_price) as they should be sent. Snapped
+            values are plain decimal strings (never exponent notation, which
+            Binance rejects); the inputs are returned unchanged if the
+            symbol's filters are not cached.
+
+        Raises:
+            ValueError: if quantity floors to zero.
+        """
+        steps = self._symbol_steps.get(symbol)
+        if steps is None:
+            return quantity, price, stop_price
+        tick, step = steps
+        price_rounding = ROUND_FLOOR if side == "BUY" else ROUND_CEILING
+
+        def _snap(value: float, inc: Decimal, rounding: str) -> Decimal:
+            d = Decimal(str(value))
+            return (d / inc).to_integral_value(rounding) * inc if inc else d
+
+        rounded_qty = _snap(quantity, step, ROUND_FLOOR)
+        if rounded_qty <= 0:
+            raise ValueError(f"Quantity {quantity} is below the minimum step {step} for {symbol}.")
+        return (
+            format(rounded_qty, "f"),
+            None if price is None else format(_snap(price, tick, price_rounding), "f"),
+            None if stop_price is None else format(_snap(stop_price, tick, price_rounding), "f"),
+        )
 
     def place_order(
         self,
@@ -140,37 +400,105 @@ class BinanceFuturesClient:
         stop_price   : Required for STOP_MARKET orders
         reduce_only  : Whether this is a reduce-only order
         """
-        params: dict[str, Any] = {
-            "symbol": symbol,
-            "side": side,
-            "type": order_type,
-            "quantity": quantity,
-        }
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, time_in_force, stop_price, reduce_only
+        )
+        return self._request("POST", "/fapi/v1/order", params)
 
-        if order_type == "LIMIT":
-            if price is None:
-                raise ValueError("price is required for LIMIT orders")
-            params["price"] = price
-            params["timeInForce"] = time_in_force
+    def place_orders(self, orders: list[dict]) -> list[Any]:
+        """
+        Place several orders concurrently via :meth:`batch`.
 
-        if order_type == "STOP_MARKET":
-            if stop_price is None:
-                raise ValueError("stopPrice is required for STOP_MARKET orders")
-            params["stopPrice"] = stop_price
+        Each item holds the keyword arguments of :meth:`place_order`.
+        Returns one entry per order, in order: the Binance response dict,
+        or the exception that order failed with (see :meth:`batch`). An
+        order whose params are invalid gets its ValueError and is not sent.
+        """
+        results: list[Any] = [None] * len(orders)
+        calls: list[BatchCall] = []
+        slots: list[int] = []
+        for i, o in enumerate(orders):
+            try:
+                params = self._build_order_params(**o)
+            except ValueError as exc:
+                logger.error("Order #%d (%s) not sent: %s", i, o.get("symbol"), exc)
+                results[i] = exc
+                continue
+            calls.append({"method": "POST", "endpoint": "/fapi/v1/order", "params": params})
+            slots.append(i)
+        for i, result in zip(slots, self.batch(calls)):
+            results[i] = result
+        return results
+
+    def batch(self, calls: list[BatchCall]) -> list[Any]:
+        """
+        Execute several REST calls, running independent ones concurrently.
 
-        if reduce_only:
-            params["reduceOnly"] = "true"
+        Calls are grouped into dependency layers by ``input_from`` and each
+        layer is issued in parallel over the pooled session, so N calls cost
+        roughly one round-trip per layer instead of N.
 
-        logger.info(
-            "Placing %s %s order | symbol=%s qty=%s price=%s",
-            side,
-            order_type,
-            symbol,
-            quantity,
-            price or stop_price or "N/A",
-        )
+        A failing call does not abort the batch: its slot holds the exception
+        instead, so results of calls that did succeed (e.g. orders already
+        accepted) are never lost. A call whose ``input_from`` source failed,
+        or lacks a needed key, gets a ValueError and is not sent.
 
-        return self._request("POST", "/fapi/v1/order", params)
+        Returns:
+            Per call, in the same order as ``calls``: the parsed response or
+            the exception (BinanceAPIError, requests.RequestException,
+            ValueError) it failed with.
+
+        Raises:
+            ValueError: if ``input_from`` does not reference an earlier call.
+        """
+        if not calls:
+            return []
+
+        depth: list[int] = []
+        for i, call in enumerate(calls):
+            src = call.get("input_from")
+            if src is None:
+                depth.append(0)
+            elif 0 <= src < i:
+                depth.append(depth[src] + 1)
+            else:
+                raise ValueError(f"Batch call {i}: input_from must reference an earlier call, got {src}.")
+
+        layers: list[list[int]] = [[] for _ in range(max(depth) + 1)]
+        for i, d in enumerate(depth):
+            layers[d].append(i)
+
+        results: list[Any] = [None] * len(calls)
+        if self._time_sync_due():
+            self._sync_time()  # once here rather than racing in every worker
+
+        def resolve(i: int, call: BatchCall, src: int) -> dict:
+            source = results[src]
+            if isinstance(source, Exception):
+                raise ValueError(f"Batch call {i}: not sent, call {src} failed: {source}") from source
+            params = dict(call["params"])  # keep the caller's dict intact
+            for key, value in params.items():
+                if value is None:
+                    if not isinstance(source, dict) or key not in source:
+                        raise ValueError(f"Batch call {i}: result of call {src} has no '{key}'.")
+                    params[key] = source[key]
+            return params
+
+        def run(i: int) -> Any:
+            call = calls[i]
+            try:
+                src = call.get("input_from")
+                params = call["params"] if src is None else resolve(i, call, src)
+                return self._request(call["method"], call["endpoint"], params)
+            except Exception as exc:
+                logger.error("Batch call %d (%s %s) failed: %s", i, call["method"], call["endpoint"], exc)
+                return exc
+
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            for layer in layers:
+                for i, result in zip(layer, executor.map(run, layer)):
+                    results[i] = result
+        return results
 
     def get_open_orders(self, symbol: str | None = None) -> list:
         """Fetch all open orders, optionally filtered by symbol."""
@@ -187,6 +515,19 @@ class BinanceFuturesClient:
             {"symbol": symbol.upper(), "orderId": order_id},
         )
 
+    def cancel_orders(self, symbol: str, order_ids: list[int]) -> list[Any]:
+        """
+        Cancel several orders for one symbol concurrently.
+        Returns, per order id, the response or the exception it failed with.
+        """
+        symbol = symbol.upper()
+        return self.batch(
+            [
+                {"method": "DELETE", "endpoint": "/fapi/v1/order", "params": {"symbol": symbol, "orderId": oid}}
+                for oid in order_ids
+            ]
+        )
+
     def get_account_balance(self) -> list:
         """Return futures wallet balances."""
         return self._request("GET", "/fapi/v2/balance", {})
@@ -3,14 +3,19 @@ Logging configuration for the Trading Bot.
 Sets up both file and console handlers with structured formatting.
 """
 
+import functools
 import logging
 import os
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
 def setup_logging(log_dir: str = "logs") -> logging.Logger:
     """
     Configure and return a logger with file + console handlers.
+    Cached, so the modules that call this at import share one configured
+    logger without repeating the directory / date work.
 
     Args:
         log_dir: Directory where log files will be stored.
@@ -30,13 +35,20 @@ def setup_logging(log_dir: str = "logs") -> logging.Logger:
         return logger
 
     # ── File Handler (DEBUG+) ──────────────────────────────────────────────
+    # Size-capped file, opened on first write. DEBUG records are buffered in
+    # memory and written in bulk; INFO+ (the order audit trail) and exit
+    # flush immediately, so a killed session never loses placed orders.
     file_fmt = logging.Formatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    fh = logging.FileHandler(log_filename, encoding="utf-8")
+    rfh = RotatingFileHandler(
+        log_filename, maxBytes=50_000_000, backupCount=5, encoding="utf-8", delay=True
+    )
+    rfh.setLevel(logging.DEBUG)
+    rfh.setFormatter(file_fmt)
+    fh = MemoryHandler(capacity=1024, flushLevel=logging.INFO, target=rfh)
     fh.setLevel(logging.DEBUG)
-    fh.setFormatter(file_fmt)
 
     # ── Console Handler (INFO+) ────────────────────────────────────────────
     console_fmt = logging.Formatter(
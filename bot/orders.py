@@ -5,11 +5,14 @@ Sits between the CLI and the raw Binance client.
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
+import requests
+
 from bot.client import BinanceFuturesClient, BinanceAPIError
 from bot.logging_config import setup_logging
-from bot.validators import validate_all
+from bot.validators import validate_all, validate_all_batch
 
 logger = setup_logging()
 
@@ -23,42 +26,107 @@ BOLD   = "\033[1m"
 RESET  = "\033[0m"
 
 
+# Rule lines are constant, so build them once rather than on every print.
+_BAR = "━" * 50
+_CYAN_BAR = f"{CYAN}{_BAR}{RESET}"
+_GREEN_BAR = f"{GREEN}{_BAR}{RESET}"
+
+# Fixed header/footer blocks with ANSI codes already interpolated; only the
+# per-order fields are formatted at print time.
+_SUMMARY_HEAD = f"\n{BOLD}{_CYAN_BAR}\n{BOLD}  📋  ORDER SUMMARY{RESET}\n{_CYAN_BAR}"
+_SUMMARY_TAIL = f"{_CYAN_BAR}\n"
+_RESPONSE_HEAD = f"\n{BOLD}{GREEN}  ✅  ORDER PLACED SUCCESSFULLY{RESET}\n{_GREEN_BAR}"
+_RESPONSE_TAIL = f"{_GREEN_BAR}\n"
+
+
 def _fmt(colour: str, text: str) -> str:
     return f"{colour}{text}{RESET}"
 
 
 def _print_order_summary(params: dict) -> None:
     """Print a formatted order request summary."""
-    print(f"\n{BOLD}{CYAN}{'━' * 50}{RESET}")
-    print(f"{BOLD}  📋  ORDER SUMMARY{RESET}")
-    print(f"{CYAN}{'━' * 50}{RESET}")
-    print(f"  Symbol     : {_fmt(BOLD, params['symbol'])}")
-    print(f"  Side       : {_fmt(GREEN if params['side'] == 'BUY' else RED, params['side'])}")
-    print(f"  Type       : {params['order_type']}")
-    print(f"  Quantity   : {params['quantity']}")
+    lines = [
+        _SUMMARY_HEAD,
+        f"  Symbol     : {_fmt(BOLD, params['symbol'])}",
+        f"  Side       : {_fmt(GREEN if params['side'] == 'BUY' else RED, params['side'])}",
+        f"  Type       : {params['order_type']}",
+        f"  Quantity   : {params['quantity']}",
+    ]
     if params.get("price"):
-        print(f"  Price      : {params['price']}")
+        lines.append(f"  Price      : {params['price']}")
     if params.get("stop_price"):
-        print(f"  Stop Price : {params['stop_price']}")
-    print(f"{CYAN}{'━' * 50}{RESET}\n")
+        lines.append(f"  Stop Price : {params['stop_price']}")
+    lines.append(_SUMMARY_TAIL)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_order_response(response: dict) -> None:
     """Print a formatted order response from Binance."""
-    print(f"\n{BOLD}{GREEN}  ✅  ORDER PLACED SUCCESSFULLY{RESET}")
-    print(f"{GREEN}{'━' * 50}{RESET}")
-    print(f"  Order ID      : {response.get('orderId', 'N/A')}")
-    print(f"  Client OID    : {response.get('clientOrderId', 'N/A')}")
-    print(f"  Symbol        : {response.get('symbol', 'N/A')}")
-    print(f"  Status        : {_fmt(YELLOW, response.get('status', 'N/A'))}")
-    print(f"  Side          : {response.get('side', 'N/A')}")
-    print(f"  Type          : {response.get('type', 'N/A')}")
-    print(f"  Orig Qty      : {response.get('origQty', 'N/A')}")
-    print(f"  Executed Qty  : {response.get('executedQty', 'N/A')}")
     avg = response.get("avgPrice") or response.get("price", "N/A")
-    print(f"  Avg Price     : {avg}")
-    print(f"  Update Time   : {response.get('updateTime', 'N/A')}")
-    print(f"{GREEN}{'━' * 50}{RESET}\n")
+    sys.stdout.write(
+        "\n".join(
+            [
+                _RESPONSE_HEAD,
+                f"  Order ID      : {response.get('orderId', 'N/A')}",
+                f"  Client OID    : {response.get('clientOrderId', 'N/A')}",
+                f"  Symbol        : {response.get('symbol', 'N/A')}",
+                f"  Status        : {_fmt(YELLOW, response.get('status', 'N/A'))}",
+                f"  Side          : {response.get('side', 'N/A')}",
+                f"  Type          : {response.get('type', 'N/A')}",
+                f"  Orig Qty      : {response.get('origQty', 'N/A')}",
+                f"  Executed Qty  : {response.get('executedQty', 'N/A')}",
+                f"  Avg Price     : {avg}",
+                f"  Update Time   : {response.get('updateTime', 'N/A')}",
+                _RESPONSE_TAIL,
+            ]
+        )
+        + "\n"
+    )
+
+
+def _print_order_error(exc: Exception) -> None:
+    """Print a formatted order failure (Binance API error or otherwise)."""
+    if isinstance(exc, BinanceAPIError):
+        detail = f"  Code    : {exc.code}\n  Message : {exc.message}\n"
+    else:
+        detail = f"  Error   : {exc}\n"
+    sys.stdout.write(
+        f"\n{RED}{_BAR}\n"
+        f"  ❌  ORDER FAILED\n"
+        f"{_BAR}\n"
+        f"{detail}"
+        f"{_BAR}{RESET}\n\n"
+    )
+
+
+def _known_symbols(client: BinanceFuturesClient) -> set[str] | None:
+    """
+    Return the exchange's listed symbols for local validation, or None if
+    exchange info cannot be fetched (Binance will then validate the symbol).
+    """
+    try:
+        return client.known_symbols()
+    except (BinanceAPIError, requests.RequestException) as exc:
+        logger.warning("Could not load exchange info, skipping symbol check: %s", exc)
+        return None
+
+
+def _apply_exchange_filters(client: BinanceFuturesClient, params: dict) -> dict:
+    """
+    Round validated params to the symbol's tick/step size (see client.round_order).
+    Rounded quantity/price values become plain decimal strings, ready to send.
+    """
+    params["quantity"], price, stop_price = client.round_order(
+        params["symbol"],
+        params["side"],
+        params["quantity"],
+        params.get("price"),
+        params.get("stop_price"),
+    )
+    params["price"] = price
+    if "stop_price" in params:
+        params["stop_price"] = stop_price
+    return params
 
 
 def place_order(
@@ -70,10 +138,16 @@ def place_order(
     price: float | None = None,
     stop_price: float | None = None,
     reduce_only: bool = False,
+    use_exchange_info: bool = False,
 ) -> dict[str, Any]:
     """
     Validate inputs, place an order via the client, and pretty-print results.
 
+    With ``use_exchange_info`` the symbol is checked against the exchange
+    listing and the order is rounded to its tick/step size before the
+    summary is shown. This downloads exchangeInfo (cached for 5 minutes),
+    so it is meant for long-lived sessions rather than one-shot CLI calls.
+
     Returns:
         Binance API order response dict.
 
@@ -90,7 +164,9 @@ def place_order(
         quantity=quantity,
         price=price,
         stop_price=stop_price,
+        known_symbols=_known_symbols(client) if use_exchange_info else None,
     )
+    params = _apply_exchange_filters(client, params)
     logger.debug("Validated params: %s", params)
 
     # ── 2. Print summary ────────────────────────────────────────────────
@@ -109,12 +185,7 @@ def place_order(
         )
     except BinanceAPIError as exc:
         logger.error("Binance API error: %s", exc)
-        print(f"\n{RED}{'━' * 50}")
-        print(f"  ❌  ORDER FAILED")
-        print(f"{'━' * 50}")
-        print(f"  Code    : {exc.code}")
-        print(f"  Message : {exc.message}")
-        print(f"{'━' * 50}{RESET}\n")
+        _print_order_error(exc)
         raise
 
     # ── 4. Log & print response ─────────────────────────────────────────
@@ -126,3 +197,71 @@ def place_order(
     )
     _print_order_response(response)
     return response
+
+
+def place_orders(
+    client: BinanceFuturesClient,
+    orders: list[dict],
+    reduce_only: bool = False,
+) -> list[Any]:
+    """
+    Validate a list of orders up front, then submit them concurrently.
+    Symbols are checked and orders rounded using exchange info, as for
+    :func:`place_order` with ``use_exchange_info``.
+
+    Every order's outcome is logged and printed; one failure does not hide
+    the orders that were placed alongside it.
+
+    Args:
+        orders: Dicts of :func:`place_order` keyword arguments
+                (symbol, side, order_type, quantity, price, stop_price).
+
+    Returns:
+        One entry per order, in the same order as ``orders``: the Binance
+        response dict, or the exception that order failed with
+        (BinanceAPIError, requests.RequestException).
+
+    Raises:
+        ValueError: on invalid inputs (nothing is sent).
+    """
+    validated = []
+    for i, params in enumerate(validate_all_batch(orders, _known_symbols(client))):
+        try:
+            validated.append(_apply_exchange_filters(client, params))
+        except ValueError as exc:
+            raise ValueError(f"Order #{i}: {exc}") from exc
+    for params in validated:
+        _print_order_summary(params)
+
+    outcomes = client.place_orders(
+        [
+            {
+                "symbol": params["symbol"],
+                "side": params["side"],
+                "order_type": params["order_type"],
+                "quantity": params["quantity"],
+                "price": params.get("price"),
+                "stop_price": params.get("stop_price"),
+                "reduce_only": reduce_only,
+            }
+            for params in validated
+        ]
+    )
+
+    for params, outcome in zip(validated, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Order failed | symbol=%s side=%s: %s", params["symbol"], params["side"], outcome)
+            _print_order_error(outcome)
+            continue
+        logger.info(
+            "Order placed | id=%s status=%s executedQty=%s",
+            outcome.get("orderId"),
+            outcome.get("status"),
+            outcome.get("executedQty"),
+        )
+        _print_order_response(outcome)
+
+    failed = sum(isinstance(o, Exception) for o in outcomes)
+    if failed:
+        logger.warning("Batch finished: %d placed, %d failed", len(outcomes) - failed, failed)
+    return outcomes
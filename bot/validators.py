@@ -5,22 +5,37 @@ All validation errors raise ValueError with human-readable messages.
 
 from __future__ import annotations
 
+from typing import Any
+
 VALID_SIDES = {"BUY", "SELL"}
 VALID_ORDER_TYPES = {"MARKET", "LIMIT", "STOP_MARKET"}
 
+# Fast-path lookups for already-clean upper/lower-case input; anything else
+# (padding, mixed case, typos) falls through to the normalise-and-check path.
+_SIDE_MAP = {alias: side for side in VALID_SIDES for alias in (side, side.lower())}
+_ORDER_TYPE_MAP = {alias: t for t in VALID_ORDER_TYPES for alias in (t, t.lower())}
+
 
-def validate_symbol(symbol: str) -> str:
-    """Ensure symbol is non-empty and uppercase."""
+def validate_symbol(symbol: str, known: set[str] | None = None) -> str:
+    """
+    Ensure symbol is non-empty and uppercase.
+    If ``known`` (the exchange's listed symbols) is given, it must be in it.
+    """
     symbol = symbol.strip().upper()
     if not symbol:
         raise ValueError("Symbol cannot be empty.")
     if not symbol.isalnum():
         raise ValueError(f"Symbol '{symbol}' contains invalid characters.")
+    if known and symbol not in known:
+        raise ValueError(f"Symbol '{symbol}' is not listed on the exchange.")
     return symbol
 
 
 def validate_side(side: str) -> str:
     """Ensure side is BUY or SELL."""
+    normalised = _SIDE_MAP.get(side)
+    if normalised is not None:
+        return normalised
     side = side.strip().upper()
     if side not in VALID_SIDES:
         raise ValueError(f"Side must be one of {VALID_SIDES}, got '{side}'.")
@@ -29,6 +44,9 @@ def validate_side(side: str) -> str:
 
 def validate_order_type(order_type: str) -> str:
     """Ensure order type is one of the supported types."""
+    normalised = _ORDER_TYPE_MAP.get(order_type)
+    if normalised is not None:
+        return normalised
     order_type = order_type.strip().upper()
     if order_type not in VALID_ORDER_TYPES:
         raise ValueError(f"Order type must be one of {VALID_ORDER_TYPES}, got '{order_type}'.")
@@ -62,24 +80,52 @@ def validate_all(
     quantity: float,
     price: float | None = None,
     stop_price: float | None = None,
+    known_symbols: set[str] | None = None,
 ) -> dict:
     """
     Run all validations and return a clean params dict.
+    ``known_symbols`` is forwarded to :func:`validate_symbol`.
 
     Returns:
         Dict with validated and normalised parameters.
     """
-    validated = {
-        "symbol": validate_symbol(symbol),
-        "side": validate_side(side),
-        "order_type": validate_order_type(order_type),
+    symbol = validate_symbol(symbol, known_symbols)
+    side = validate_side(side)
+    order_type = validate_order_type(order_type)
+    validated: dict[str, Any] = {
+        "symbol": symbol,
+        "side": side,
+        "order_type": order_type,
         "quantity": validate_quantity(quantity),
-        "price": validate_price(price, order_type.strip().upper()),
+        "price": validate_price(price, order_type),
     }
 
-    if order_type.strip().upper() == "STOP_MARKET":
+    if order_type == "STOP_MARKET":
         if stop_price is None or stop_price <= 0:
             raise ValueError("stop_price is required and must be > 0 for STOP_MARKET orders.")
         validated["stop_price"] = stop_price
 
     return validated
+
+
+def validate_all_batch(orders: list[dict], known_symbols: set[str] | None = None) -> list[dict]:
+    """
+    Validate many orders in a single pass.
+
+    Args:
+        orders:        Dicts of :func:`validate_all` keyword arguments.
+        known_symbols: Forwarded to :func:`validate_symbol`.
+
+    Returns:
+        Validated params dicts, in the same order as ``orders``.
+
+    Raises:
+        ValueError: naming the index of the first invalid order.
+    """
+    validated = []
+    for i, order in enumerate(orders):
+        try:
+            validated.append(validate_all(**order, known_symbols=known_symbols))
+        except ValueError as exc:
+            raise ValueError(f"Order #{i}: {exc}") from exc
+    return validated
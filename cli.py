@@ -21,10 +21,13 @@ Credentials: set env vars  BINANCE_API_KEY  and  BINANCE_API_SECRET
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
 import textwrap
 
+import requests
+
 from bot.client import BinanceFuturesClient, BinanceAPIError
 from bot.logging_config import setup_logging
 from bot.orders import place_order
@@ -46,6 +49,17 @@ BANNER = f"""{CYAN}{BOLD}
 ╚══════════════════════════════════════════════════════════╝{RESET}
 """
 
+_CYAN_BAR = f"{CYAN}{'━' * 50}{RESET}"
+
+MAIN_MENU = (
+    f"\n{BOLD}  MAIN MENU{RESET}\n"
+    "  [1]  Place an Order\n"
+    "  [2]  View Account Balance\n"
+    "  [3]  View Open Orders\n"
+    "  [4]  Cancel an Order\n"
+    "  [q]  Quit\n\n"
+)
+
 
 # ── Credential helpers ────────────────────────────────────────────────────
 
@@ -96,15 +110,14 @@ def cmd_balance(args: argparse.Namespace) -> None:
     client = _get_client(args)
     try:
         balances = client.get_account_balance()
-        print(f"\n{BOLD}{CYAN}{'━'*50}{RESET}")
-        print(f"{BOLD}  💰  ACCOUNT BALANCES{RESET}")
-        print(f"{CYAN}{'━'*50}{RESET}")
+        lines = [f"\n{BOLD}{_CYAN_BAR}", f"{BOLD}  💰  ACCOUNT BALANCES{RESET}", _CYAN_BAR]
         for asset in balances:
             bal = float(asset.get("balance", 0))
             if bal > 0:
-                print(f"  {asset['asset']:8s}  Balance: {bal:.4f}  "
-                      f"Available: {float(asset.get('availableBalance', 0)):.4f}")
-        print(f"{CYAN}{'━'*50}{RESET}\n")
+                lines.append(f"  {asset['asset']:8s}  Balance: {bal:.4f}  "
+                             f"Available: {float(asset.get('availableBalance', 0)):.4f}")
+        lines.append(f"{_CYAN_BAR}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     except BinanceAPIError as exc:
         sys.exit(f"❌  {exc}")
 
@@ -115,12 +128,7 @@ def cmd_interactive(args: argparse.Namespace) -> None:
     client = _get_client(args)
 
     while True:
-        print(f"\n{BOLD}  MAIN MENU{RESET}")
-        print("  [1]  Place an Order")
-        print("  [2]  View Account Balance")
-        print("  [3]  View Open Orders")
-        print("  [4]  Cancel an Order")
-        print("  [q]  Quit\n")
+        sys.stdout.write(MAIN_MENU)
 
         choice = input("  Select option: ").strip().lower()
 
@@ -151,9 +159,7 @@ def _prompt(label: str, default: str | None = None) -> str:
 
 
 def _interactive_place_order(client: BinanceFuturesClient) -> None:
-    print(f"\n{CYAN}{'━'*50}{RESET}")
-    print(f"{BOLD}  📝  PLACE ORDER{RESET}")
-    print(f"{CYAN}{'━'*50}{RESET}")
+    sys.stdout.write(f"\n{_CYAN_BAR}\n{BOLD}  📝  PLACE ORDER{RESET}\n{_CYAN_BAR}\n")
 
     symbol     = _prompt("Symbol (e.g. BTCUSDT)", "BTCUSDT").upper()
     side       = _prompt("Side   [BUY/SELL]", "BUY").upper()
@@ -181,6 +187,23 @@ def _interactive_place_order(client: BinanceFuturesClient) -> None:
             print(f"{RED}  ❌  Invalid stop price.{RESET}")
             return
 
+    # Round to the exchange's tick/step size now, so the user confirms
+    # exactly what will be sent.
+    try:
+        client.known_symbols()
+        rounded = client.round_order(symbol, side, qty, price, stop_price)
+    except ValueError as exc:
+        print(f"{RED}  ❌  {exc}{RESET}")
+        return
+    except (BinanceAPIError, requests.RequestException) as exc:
+        logger.warning("Could not load exchange info, order not rounded: %s", exc)
+        rounded = (qty, price, stop_price)
+    # place_order() re-applies the same rounding, so this is display only.
+    if tuple(None if v is None else float(v) for v in rounded) != (qty, price, stop_price):
+        r_qty, r_price, r_stop = rounded
+        print(f"{YELLOW}  Rounded to exchange tick/step size → qty={r_qty} "
+              f"price={r_price if r_price is not None else r_stop}{RESET}")
+
     confirm = _prompt("Confirm order? [yes/no]", "yes").lower()
     if confirm not in {"yes", "y"}:
         print(f"{YELLOW}  Order cancelled.{RESET}")
@@ -195,6 +218,7 @@ def _interactive_place_order(client: BinanceFuturesClient) -> None:
             quantity=qty,
             price=price,
             stop_price=stop_price,
+            use_exchange_info=True,
         )
     except (ValueError, BinanceAPIError) as exc:
         logger.error("Interactive order error: %s", exc)
@@ -207,10 +231,11 @@ def _interactive_open_orders(client: BinanceFuturesClient) -> None:
         if not orders:
             print(f"{YELLOW}  No open orders found.{RESET}")
             return
-        print(f"\n{BOLD}  Open Orders ({len(orders)}){RESET}")
+        lines = [f"\n{BOLD}  Open Orders ({len(orders)}){RESET}"]
         for o in orders:
-            print(f"  [{o['orderId']}] {o['symbol']} {o['side']} {o['type']} "
-                  f"qty={o['origQty']} price={o.get('price','N/A')} status={o['status']}")
+            lines.append(f"  [{o['orderId']}] {o['symbol']} {o['side']} {o['type']} "
+                         f"qty={o['origQty']} price={o.get('price','N/A')} status={o['status']}")
+        sys.stdout.write("\n".join(lines) + "\n")
     except BinanceAPIError as exc:
         print(f"{RED}  ❌  {exc}{RESET}")
 
@@ -230,7 +255,9 @@ def _interactive_cancel_order(client: BinanceFuturesClient) -> None:
 
 # ── Argument parser ───────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated calls (e.g. main() used as a library) reuse it."""
     parser = argparse.ArgumentParser(
         prog="trading_bot",
         formatter_class=argparse.RawDescriptionHelpFormatter,